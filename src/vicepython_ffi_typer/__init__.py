@@ -10,8 +10,11 @@ Public API (minimal by design):
     Exit: Exception for explicit exit codes (re-exported from typer)
 """
 
-from .run import run
-from .typed_typer import Argument, Exit, Option, TypedTyper
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .run import run
+    from .typed_typer import Argument, Exit, Option, TypedTyper
 
 __all__ = [
     # Core API
@@ -25,3 +28,29 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+# PEP 562 lazy re-exports: importing the package is cheap until the first
+# attribute access, so callers that only touch __version__ never pay for
+# Typer or vicepython_core.
+_LAZY = {
+    "run": ".run",
+    "TypedTyper": ".typed_typer",
+    "Argument": ".typed_typer",
+    "Option": ".typed_typer",
+    "Exit": ".typed_typer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        import importlib
+
+        mod = importlib.import_module(_LAZY[name], __name__)
+        val = getattr(mod, name)
+        globals()[name] = val
+        return val
+    raise AttributeError(name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
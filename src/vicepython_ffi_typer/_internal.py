@@ -3,19 +3,26 @@
 This module is private - never imported by user code.
 """
 
-from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
 class _CommandError(Exception):
     """Command handler returned Err(e). Caught only by run() boundary.
 
     This exception is an implementation detail of the Result contract.
     User code never sees it - only run() catches and handles it.
 
+    Raised once per failing command and immediately caught, so it skips the
+    dataclass machinery: __slots__ avoids generated __repr__/__eq__ code and
+    the hand-written __init__ is a single attribute store.
+
     Attributes:
         error: The E from Result[None, E]. Must have suitable __str__.
     """
 
-    error: Any  # Any because we don't constrain E at type level
+    __slots__ = ("error",)
+
+    def __init__(self, error: Any) -> None:
+        # Any because we don't constrain E at type level
+        self.error = error
+        Exception.__init__(self)
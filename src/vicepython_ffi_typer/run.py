@@ -13,26 +13,90 @@ Contract (Posture A - Strict VicePython):
 """
 
 import sys
-
-from click.exceptions import NoArgsIsHelpError
+from operator import attrgetter
+from typing import Callable
 
 from ._internal import _CommandError
-from .typed_typer import Exit, TypedTyper
+from .typed_typer import TypedTyper
+
+# Typer (and transitively click) is deliberately not imported at module level.
+# The happy path imports it via app._app(...); the exception path resolves the
+# Exit classes lazily so error-only callers never pay the Typer import cost.
+_exit_cls: tuple[type[BaseException], ...] | None = None
+_no_args_is_help_cls: type[BaseException] | None = None
+
+# Constant messages, built once at import instead of per raise/print
+_EMPTY_ARGV_MSG = "argv must not be empty - argv[0] should be program name"
+_BUG_SYSTEMEXIT_MSG = "Unexpected error (bug): SystemExit\n"
+
+# Bug messages keyed by exception type, built lazily on first occurrence so
+# repeated failures of the same kind reuse one formatted string
+_bug_msg_cache: dict[type, str] = {}
+
+# Builtin exception classes used in run()'s dispatch, bound as module
+# globals so the handler does a single global lookup instead of the
+# globals-then-builtins probe a bare name costs.
+_SystemExit = SystemExit
+_Exception = Exception
+
+
+def _get_exit_cls() -> tuple[type[BaseException], ...]:
+    """Resolve and cache the framework Exit classes on first use.
+
+    Both mean "exit with this code": typer.Exit escapes the direct-dispatch
+    fast path, click's Exit escapes Command.invoke() on the Typer path
+    (Typer converts its own Exit to click's, and --help's ctx.exit() raises
+    click's directly). By the time an exception reaches run()'s boundary,
+    both packages are already in sys.modules (the app just ran), so these
+    imports are dict lookups.
+    """
+    global _exit_cls
+    if _exit_cls is None:
+        import typer
+        from click.exceptions import Exit as _ClickExit
+
+        _exit_cls = (typer.Exit, _ClickExit)
+    return _exit_cls
+
+
+def _get_no_args_is_help_cls() -> type[BaseException]:
+    """Resolve and cache click's NoArgsIsHelpError on first use."""
+    global _no_args_is_help_cls
+    if _no_args_is_help_cls is None:
+        from click.exceptions import NoArgsIsHelpError
 
+        _no_args_is_help_cls = NoArgsIsHelpError
+    return _no_args_is_help_cls
 
-def _exit_code_from_exit(e: Exit) -> int:
-    """Extract exit code from Typer Exit exception.
 
-    Typer's Exit may use .exit_code or .code depending on version.
-    This helper provides a single extraction point.
+# Resolved accessor for the Exit exit-code attribute. Which attribute the
+# framework uses (.exit_code vs .code) is fixed per installed version, so the
+# first Exit seen picks the accessor and every later call is a single C-level
+# attrgetter fetch.
+_exit_code_getter: Callable[[BaseException], int] | None = None
+
+
+def _exit_code_from_exit(e: BaseException) -> int:
+    """Extract exit code from a framework Exit exception.
+
+    The Exit classes may use .exit_code or .code depending on version.
+    This helper provides a single extraction point. The attribute probe runs
+    once per process; subsequent calls go straight through the cached
+    attrgetter. (Peeking e.__dict__ instead is not an option: Typer's Exit
+    stores exit_code in a __slots__ slot, so the instance dict is empty.)
     """
-    if hasattr(e, "exit_code"):
-        code = e.exit_code
-        return code if isinstance(code, int) else 0
-    if hasattr(e, "code"):
-        code = e.code
-        return code if isinstance(code, int) else 0
-    return 0
+    global _exit_code_getter
+    if _exit_code_getter is None:
+        if getattr(e, "exit_code", None) is not None:
+            _exit_code_getter = attrgetter("exit_code")
+        elif getattr(e, "code", None) is not None:
+            _exit_code_getter = attrgetter("code")
+        else:
+            return 0
+    code = _exit_code_getter(e)
+    # Exact-type compare: Typer never subclasses int for exit codes, so this
+    # is a pointer check instead of isinstance's MRO walk.
+    return code if type(code) is int else 0
 
 
 def run(app: TypedTyper, argv: list[str]) -> int:
@@ -85,26 +149,58 @@ def run(app: TypedTyper, argv: list[str]) -> int:
         sys.exit(run(app, sys.argv))
     """
     if not argv:
-        raise ValueError("argv must not be empty - argv[0] should be program name")
-
-    # Mutates process global state; not re-entrant but acceptable at CLI boundary
-    old_argv = sys.argv
+        raise ValueError(_EMPTY_ARGV_MSG)
+
+    # Fast path: bare --help needs no argv parsing, so serve it from the
+    # app's cached help text instead of invoking Typer/Click. (-h is not a
+    # recognized flag in the underlying app, so it is deliberately excluded.)
+    # A None render means the help couldn't be captured; fall through to the
+    # full Typer path below rather than print nothing.
+    if len(argv) == 2 and argv[1] == "--help":
+        help_text = app._help_text(argv[0])
+        if help_text is not None:
+            sys.stdout.write(help_text)
+            return 0
+
+    # argv is passed straight through to Click; sys.argv is never touched,
+    # so run() is re-entrant and safe under parallel test execution.
     try:
-        sys.argv = argv
-        app._app(standalone_mode=False)
+        # Plain positional command invocations dispatch straight to the
+        # handler, skipping Click entirely; anything fancier resolves to
+        # None and takes the full Typer path. A framework Exit(N) raised on
+        # either path propagates into the handlers below (the fast path
+        # raises typer.Exit, the Typer path click's Exit), so the
+        # documented Exit(N) -> N contract holds identically for both.
+        invoke_simple = app._resolve_simple(argv)
+        if invoke_simple is not None:
+            invoke_simple()
+        else:
+            app._invoke(argv)
         return 0
     except _CommandError as e:
-        print(str(e.error), file=sys.stderr)
+        # Format first, then emit as one write: print() does separate
+        # sep/end attribute lookups and writes, and would hold the stderr
+        # lock for the duration of an expensive __str__.
+        message = f"{e.error}\n"
+        sys.stderr.write(message)
         return 1
-    except Exit as e:
-        return _exit_code_from_exit(e)
-    except NoArgsIsHelpError:
-        return 0
-    except SystemExit:
-        print("Unexpected error (bug): SystemExit", file=sys.stderr)
-        return 2
-    except Exception as e:
-        print(f"Unexpected error (bug): {type(e).__name__}", file=sys.stderr)
-        return 2
-    finally:
-        sys.argv = old_argv
+    except BaseException as e:
+        # Dispatch by isinstance rather than except clauses so the framework
+        # exception classes (typer.Exit, click's NoArgsIsHelpError) are only
+        # resolved once an exception actually fires.
+        if isinstance(e, _get_exit_cls()):
+            return _exit_code_from_exit(e)
+        if isinstance(e, _get_no_args_is_help_cls()):
+            return 0
+        if isinstance(e, _SystemExit):
+            sys.stderr.write(_BUG_SYSTEMEXIT_MSG)
+            return 2
+        if isinstance(e, _Exception):
+            t = type(e)
+            bug_msg = _bug_msg_cache.get(t)
+            if bug_msg is None:
+                bug_msg = f"Unexpected error (bug): {t.__name__}\n"
+                _bug_msg_cache[t] = bug_msg
+            sys.stderr.write(bug_msg)
+            return 2
+        raise
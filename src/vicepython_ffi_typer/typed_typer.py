@@ -8,21 +8,50 @@ type is declared separately (e.g., Annotated[str, Option(...)]).
 This is the quarantine boundary - Any stays here, concrete types flow to callers.
 """
 
-import functools
-from typing import Annotated, Any, Callable, ParamSpec, TypeVar
+from __future__ import annotations
 
-import typer as _typer
-from vicepython_core import Err, Ok, Result
+from collections.abc import Hashable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Any, Callable, ParamSpec, TypeVar, cast
 
 from ._internal import _CommandError
 
-Exit = _typer.Exit
+if TYPE_CHECKING:
+    from vicepython_core import Err, Ok, Result
+
+# Concrete Result classes for the wrapper's type dispatch, resolved lazily
+# on the first command_result() registration so importing this module never
+# drags in the vicepython_core import graph for apps that only use
+# command()/callback().
+_Ok: Any = None
+_Err: Any = None
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve Exit so importing this module doesn't import Typer.
+
+    Typer transitively pulls in click (and rich on older versions), which
+    dominates cold-start for callers that never run a command. Deferring the
+    import means only code paths that actually touch Typer pay for it.
+    """
+    if name == "Exit":
+        import typer as _typer
+
+        globals()["Exit"] = _typer.Exit
+        return _typer.Exit
+    raise AttributeError(name)
+
 
 P = ParamSpec("P")
 R = TypeVar("R")
 E = TypeVar("E")
 
 
+def _vp_internal_callback() -> None:
+    """Internal callback to force group behavior. Do not use directly."""
+    pass
+
+
 class TypedTyper:
     """Typed wrapper around Typer app with clean generic decorators."""
 
@@ -32,6 +61,7 @@ class TypedTyper:
         help: str = "",
         no_args_is_help: bool = False,
         require_subcommand: bool = False,
+        commands_hint: int = 0,
     ) -> None:
         """Initialize a TypedTyper app.
 
@@ -42,8 +72,22 @@ class TypedTyper:
                 When True, no_args_is_help is forced to True, and an internal
                 callback is registered to ensure the app behaves like a group
                 (requiring explicit subcommand invocation).
+            commands_hint: Expected number of commands, or 0 (default) for no
+                hint. When set, the Click command tree is compiled eagerly as
+                the hint-th command is registered, moving the Typer-to-Click
+                compilation cost out of the first run() call.
         """
+        import typer as _typer
+
         self._require_subcommand = require_subcommand
+        self._cached_help: tuple[str, str] | None = None  # (prog_name, text)
+        self._compiled_click: Any = None
+        self._commands_hint = commands_hint
+        self._n_commands = 0
+        # Simple-dispatch registry: command name -> (handler, converters)
+        # for commands that can run without Typer/Click (see _resolve_simple)
+        self._simple_dispatch: dict[str, tuple[Callable[..., Any], tuple[Any, ...]]] = {}
+        self._is_simple = True
         effective_no_args_is_help = require_subcommand or no_args_is_help
 
         self._app: Any = _typer.Typer(
@@ -52,10 +96,132 @@ class TypedTyper:
         )
 
         if self._require_subcommand:
-            @self._app.callback()
-            def _vp_internal_callback() -> None:
-                """Internal callback to force group behavior. Do not use directly."""
-                pass
+            # Register the shared module-level no-op rather than defining a
+            # fresh closure here: one function object for all apps, and the
+            # common require_subcommand=False path skips callback machinery
+            # entirely.
+            self._app.callback()(_vp_internal_callback)
+
+    def _resolve_simple(self, argv: list[str]) -> Callable[[], Any] | None:
+        """Match argv to a registered handler for direct dispatch, or None.
+
+        Commands whose parameters are all required positionals of plain
+        str/int/float types don't need Click at all: argv[1] names the
+        command and argv[2:] are its arguments. For those, run() can call
+        the handler directly, skipping Click context and parse-tree
+        construction entirely. Anything else - flags, defaults, callbacks,
+        single-command root apps - returns None and falls back to the full
+        Typer path, so behavior there is untouched.
+        """
+        if not self._is_simple or len(argv) < 2:
+            return None
+        # Only group-style apps dispatch by name; a single command without a
+        # forced group is the Click root and takes argv[1] as its first
+        # argument, not a command name.
+        if self._n_commands < 2 and not self._require_subcommand:
+            return None
+        entry = self._simple_dispatch.get(argv[1])
+        if entry is None:
+            return None
+        handler, converters = entry
+        raw = argv[2:]
+        if len(raw) != len(converters):
+            return None
+        args = []
+        for convert, token in zip(converters, raw):
+            if token.startswith("-"):
+                # Could be an option (or a negative number Click would
+                # special-case) - let Click decide.
+                return None
+            try:
+                args.append(convert(token))
+            except ValueError:
+                return None
+        return lambda: handler(*args)
+
+    def _note_command_registered(self) -> None:
+        """Invalidate the compile caches after a command registration.
+
+        When a commands_hint was given and the hint-th command just arrived,
+        compile eagerly so the first run() finds a warm cache. Registrations
+        beyond the hint fall back to lazy compilation on the next run().
+        """
+        self._cached_help = None
+        self._compiled_click = None
+        self._n_commands += 1
+        if self._n_commands == self._commands_hint:
+            self._compile()
+
+    def _compile(self) -> Any:
+        """Build (and cache) the Click command for this app.
+
+        Typer rebuilds the Click Command/Group from the registered callbacks
+        on every __call__; memoizing the built object means only the first
+        run() pays the Typer-to-Click compilation cost. The registration
+        decorators invalidate the cache so later registrations are picked up.
+        """
+        if self._compiled_click is None:
+            import typer as _typer
+
+            self._compiled_click = _typer.main.get_command(self._app)
+        return self._compiled_click
+
+    def _invoke(self, argv: list[str]) -> None:
+        """Run the cached Click command with explicit args.
+
+        Passing args/prog_name directly means Click never reads sys.argv,
+        so run() needs no process-global mutation. Used by run() instead
+        of _app().
+
+        Goes through make_context()/invoke() rather than main(): main()
+        with standalone_mode=False conflates a framework Exit(N) with a
+        handler's plain int return value in its result, whereas here a
+        framework Exit propagates as an exception for run() to translate
+        and handler return values are discarded - only run() determines
+        exit codes.
+        """
+        command = self._compile()
+        with command.make_context(argv[0], argv[1:]) as ctx:
+            command.invoke(ctx)
+
+    def _help_text(self, prog_name: str) -> str | None:
+        """Build (and cache) the app's top-level help text.
+
+        Rendering help through a bare click Context skips argv parsing and
+        parameter processing entirely; the string is cached so repeated
+        --help invocations are a single lookup. The cache is invalidated by
+        the registration decorators so late-registered commands show up,
+        and is keyed by prog_name so a different argv[0] re-renders the
+        usage line.
+
+        Rich-backed Typer help prints straight to stdout and makes
+        get_help() return an empty string, so the render is captured via
+        stdout redirection and combined with the return value - whichever
+        backend is active, the text ends up in the cache. Returns None if
+        nothing could be captured; callers should then fall back to the
+        full Typer path rather than serve (and cache) empty help.
+        """
+        cached = self._cached_help
+        if cached is not None and cached[0] == prog_name:
+            return cached[1]
+
+        import contextlib
+        import io
+
+        import click
+
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            with click.Context(self._compile(), info_name=prog_name) as ctx:
+                rendered = ctx.get_help()
+        if not (buffer.getvalue() + rendered).strip():
+            return None
+        # The real --help path echoes get_help()'s return value with a
+        # newline (an empty echo under rich, the whole text under plain
+        # Click); append it unconditionally so both paths are byte-identical.
+        text = buffer.getvalue() + rendered + "\n"
+        self._cached_help = (prog_name, text)
+        return text
 
     def command(
         self,
@@ -70,12 +236,7 @@ class TypedTyper:
 
         Prefer command_result() for commands that need explicit error handling.
         """
-
-        def decorator(func: Callable[P, R]) -> Callable[P, R]:
-            _ = self._app.command(name=name, help=help)(func)
-            return func
-
-        return decorator
+        return _make_command_decorator(self, name, help)
 
     def callback(
         self,
@@ -88,12 +249,7 @@ class TypedTyper:
 
         Prefer command_result() for commands that need explicit error handling.
         """
-
-        def decorator(func: Callable[P, R]) -> Callable[P, R]:
-            _ = self._app.callback(invoke_without_command=invoke_without_command)(func)
-            return func
-
-        return decorator
+        return _make_callback_decorator(self, invoke_without_command)
 
     def command_result(
         self,
@@ -131,43 +287,183 @@ class TypedTyper:
             code = run(app, ["prog", "my-command", "value"])
             assert code == 0
         """
-
-        def decorator(func: Callable[P, Result[None, E]]) -> Callable[P, Result[None, E]]:
-            @functools.wraps(func)
-            def wrapper(*args: Any, **kwargs: Any) -> Any:
-                result = func(*args, **kwargs)
-                match result:
-                    case Ok(None):
-                        return result
-                    case Err(e):
-                        raise _CommandError(error=e)
-                    case Ok(value):
-                        # Programmer error: Ok(non-None) is invalid
-                        raise TypeError(
-                            f"command_result handler must return Ok(None), "
-                            f"got Ok({value!r})"
-                        )
-                    case _:
-                        # Type system should prevent this, but fail loudly if violated
-                        raise TypeError(
-                            f"command_result handler must return Result[None, E], "
-                            f"got {type(result)}"
-                        )
-
-            # Register wrapper with Typer (pollutes with Any, we ignore)
-            _ = self._app.command(name=name, help=help)(wrapper)
-
-            # Return original function - decorator is for registration only
-            # The wrapper is internal to Typer, not exposed to callers
-            return func
-
-        return decorator
+        return _make_command_result_decorator(self, name, help)
 
     def __call__(self) -> None:
         """Run the Typer app."""
         self._app()
 
 
+def _simple_converters(func: Callable[..., Any]) -> tuple[Any, ...] | None:
+    """Per-argument converters for direct dispatch, or None if ineligible.
+
+    Eligible handlers take only required positional parameters annotated as
+    plain str/int/float (unannotated counts as str). Anything else -
+    defaults, keyword-only or variadic params, Annotated metadata, custom
+    types - defers to the full Typer path. Computed once at registration so
+    run()'s fast path does no introspection.
+    """
+    import inspect
+
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    converters: list[Any] = []
+    for param in parameters:
+        if param.kind not in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            return None
+        if param.default is not param.empty:
+            return None
+        annotation = param.annotation
+        if annotation is param.empty or annotation is str:
+            converters.append(str)
+        elif annotation is int or annotation is float:
+            converters.append(annotation)
+        else:
+            return None
+    return tuple(converters)
+
+
+def _command_name(name: str | None, func: Callable[..., Any]) -> str:
+    """Mirror Typer's default command naming (underscores become dashes)."""
+    if name is not None:
+        return name
+    return func.__name__.lower().replace("_", "-")
+
+
+# Decorator factories live at module scope so each decorator call allocates
+# one closure over a shared code object, instead of rebuilding the factory's
+# code per call inside the method bodies.
+def _make_command_decorator(
+    app: TypedTyper,
+    name: str | None,
+    help: str | None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Build the registration decorator behind TypedTyper.command()."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        _ = app._app.command(name=name, help=help)(func)
+        converters = _simple_converters(func)
+        if converters is not None:
+            app._simple_dispatch[_command_name(name, func)] = (func, converters)
+        app._note_command_registered()
+        return func
+
+    return decorator
+
+
+def _make_callback_decorator(
+    app: TypedTyper,
+    invoke_without_command: bool,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Build the registration decorator behind TypedTyper.callback()."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        _ = app._app.callback(invoke_without_command=invoke_without_command)(func)
+        app._cached_help = None
+        app._compiled_click = None
+        # A user callback may carry logic that must run before any command,
+        # so the app can no longer be dispatched without Typer.
+        app._is_simple = False
+        return func
+
+    return decorator
+
+
+def _make_command_result_decorator(
+    app: TypedTyper,
+    name: str | None,
+    help: str | None,
+) -> Callable[[Callable[P, Result[None, E]]], Callable[P, Result[None, E]]]:
+    """Build the registration decorator behind TypedTyper.command_result()."""
+
+    def decorator(func: Callable[P, Result[None, E]]) -> Callable[P, Result[None, E]]:
+        global _Ok, _Err
+        if _Ok is None:
+            from vicepython_core import Err, Ok
+
+            _Ok, _Err = Ok, Err
+        ok_cls = _Ok
+        err_cls = _Err
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = func(*args, **kwargs)
+            # Exact type dispatch: one pointer compare per arm instead of
+            # the isinstance/unbind sequence a match statement compiles to.
+            # The casts carry the narrowing mypy can't derive from comparing
+            # against the Any-typed lazy class slots.
+            t = type(result)
+            if t is ok_cls:
+                ok_result = cast("Ok[None]", result)
+                if ok_result.value is None:
+                    return result
+                # Programmer error: Ok(non-None) is invalid
+                raise TypeError(
+                    f"command_result handler must return Ok(None), "
+                    f"got Ok({ok_result.value!r})"
+                )
+            if t is err_cls:
+                raise _CommandError(cast("Err[E]", result).error)
+            # Type system should prevent this, but fail loudly if violated
+            raise TypeError(
+                f"command_result handler must return Result[None, E], "
+                f"got {t}"
+            )
+
+        # Hand-rolled subset of functools.wraps: Typer reads the name,
+        # docstring, and annotations, and resolves the real signature
+        # through __wrapped__. Skipping the full WRAPPER_ASSIGNMENTS/
+        # WRAPPER_UPDATES copy avoids per-decoration dict merges.
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__annotations__ = func.__annotations__
+        wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+
+        # Register wrapper with Typer (pollutes with Any, we ignore)
+        _ = app._app.command(name=name, help=help)(wrapper)
+        converters = _simple_converters(func)
+        if converters is not None:
+            # The wrapper, not func: direct dispatch must still translate
+            # Err(e) into _CommandError for the run() boundary.
+            app._simple_dispatch[_command_name(name, func)] = (wrapper, converters)
+        app._note_command_registered()
+
+        # Return original function - decorator is for registration only
+        # The wrapper is internal to Typer, not exposed to callers
+        return func
+
+    return decorator
+
+
+# Typer never mutates ArgumentInfo/OptionInfo after construction, so the
+# sentinels are safe to share across parameters: commands reusing the same
+# (default, help) pair get one cached object instead of a fresh allocation
+# per parameter at decoration time.
+# Empty help is not forwarded: Typer's default (None) help path skips the
+# help-string storage and formatting work that an explicit "" would incur.
+# The default's type is part of the cache key because lru_cache compares by
+# equality, and e.g. False == 0 == 0.0 - without it, Argument(default=False)
+# and Argument(default=0) would silently share one sentinel.
+@lru_cache(maxsize=128)
+def _cached_argument(default_type: Hashable, default: Hashable, help: str) -> Any:
+    import typer as _typer
+
+    if help:
+        return _typer.Argument(default=default, help=help)
+    return _typer.Argument(default=default)
+
+
+@lru_cache(maxsize=128)
+def _cached_option(help: str) -> Any:
+    import typer as _typer
+
+    if help:
+        return _typer.Option(help=help)
+    return _typer.Option()
+
+
 def Argument(  # noqa: N802
     *,
     default: Any = ...,
@@ -178,7 +474,17 @@ def Argument(  # noqa: N802
     Returns Any because it's a Typer sentinel object, but safe because
     only used in Annotated[T, Argument(...)] where T provides the actual type.
     """
-    return _typer.Argument(default=default, help=help)
+    try:
+        # cast: mypy's lru_cache stubs take Hashable and reject type[Any],
+        # though classes are always hashable
+        return _cached_argument(cast(Hashable, type(default)), default, help)
+    except TypeError:
+        # Unhashable default (e.g. a list) - fall back to a fresh sentinel
+        import typer as _typer
+
+        if help:
+            return _typer.Argument(default=default, help=help)
+        return _typer.Argument(default=default)
 
 
 def Option(  # noqa: N802
@@ -192,4 +498,4 @@ def Option(  # noqa: N802
 
     No default parameter - Typer infers it from the function parameter default value.
     """
-    return _typer.Option(help=help)
+    return _cached_option(help)
@@ -124,3 +124,25 @@ def test_help_flag_exits_cleanly(capsys: pytest.CaptureFixture[str]) -> None:
     captured = capsys.readouterr()
     assert "--help" in captured.out
     assert "bug" not in captured.err.lower()
+
+
+def test_help_flag_repeated_output_identical(capsys: pytest.CaptureFixture[str]) -> None:
+    """Repeated --help must print the full help every time, not a stale cache."""
+    app = TypedTyper(help="Test app")
+
+    @app.command_result()
+    def my_command() -> Result[None, CliError]:
+        return Ok(None)
+
+    assert run(app, ["prog", "--help"]) == 0
+    first = capsys.readouterr().out
+
+    assert run(app, ["prog", "--help"]) == 0
+    second = capsys.readouterr().out
+
+    assert "--help" in first
+    assert second == first
+
+    # A different program name re-renders the usage line
+    assert run(app, ["other", "--help"]) == 0
+    assert "other" in capsys.readouterr().out
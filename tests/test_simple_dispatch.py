@@ -0,0 +1,145 @@
+"""Tests for the simple-dispatch fast path in run().
+
+Plain positional commands may bypass Typer/Click entirely; these tests pin
+down that the fast path preserves run()'s exit-code and output contract,
+and that anything non-trivial still goes through the full Typer path.
+"""
+
+from dataclasses import dataclass
+
+import pytest
+from vicepython_core import Err, Ok, Result
+
+from vicepython_ffi_typer import TypedTyper, run
+
+
+@dataclass(frozen=True)
+class DispatchError:
+    message: str
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def _two_command_app() -> TypedTyper:
+    app = TypedTyper()
+
+    @app.command_result()
+    def add(a: int, b: int) -> Result[None, DispatchError]:
+        print(a + b)
+        return Ok(None)
+
+    @app.command_result()
+    def fail(reason: str) -> Result[None, DispatchError]:
+        return Err(DispatchError(reason))
+
+    return app
+
+
+def test_simple_dispatch_bypasses_typer(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Eligible positional invocations must not reach the Typer path."""
+    app = _two_command_app()
+
+    def _fail_invoke(argv: list[str]) -> None:
+        raise AssertionError("full Typer path should have been bypassed")
+
+    monkeypatch.setattr(app, "_invoke", _fail_invoke)
+
+    assert run(app, ["prog", "add", "2", "3"]) == 0
+    assert capsys.readouterr().out == "5\n"
+
+
+def test_simple_dispatch_err_exits_one(capsys: pytest.CaptureFixture[str]) -> None:
+    """Err(e) through the fast path keeps the exit-1/stderr contract."""
+    app = _two_command_app()
+
+    code = run(app, ["prog", "fail", "broken"])
+
+    assert code == 1
+    assert capsys.readouterr().err == "broken\n"
+
+
+def test_flags_fall_back_to_typer(capsys: pytest.CaptureFixture[str]) -> None:
+    """Option-style tokens are left to Click's parser."""
+    app = TypedTyper()
+
+    @app.command_result()
+    def greet(name: str, greeting: str | None = None) -> Result[None, DispatchError]:
+        print(f"{greeting or 'Hello'}, {name}!")
+        return Ok(None)
+
+    @app.command()
+    def noop() -> None:
+        pass
+
+    code = run(app, ["prog", "greet", "Alice", "--greeting", "Hi"])
+
+    assert code == 0
+    assert "Hi, Alice!" in capsys.readouterr().out
+
+
+def test_single_command_app_not_dispatched(capsys: pytest.CaptureFixture[str]) -> None:
+    """A lone command is the Click root; argv[1] is its argument, not a name."""
+    app = TypedTyper()
+
+    @app.command()
+    def greet(name: str) -> None:
+        print(f"Hello, {name}!")
+
+    code = run(app, ["prog", "greet"])
+
+    assert code == 0
+    assert capsys.readouterr().out == "Hello, greet!\n"
+
+
+def test_bad_int_falls_back_to_usage_error(capsys: pytest.CaptureFixture[str]) -> None:
+    """Unparseable arguments defer to Click for its usual error handling."""
+    app = _two_command_app()
+
+    code = run(app, ["prog", "add", "2", "three"])
+
+    assert code == 2
+
+
+def test_exit_code_agrees_across_paths(capsys: pytest.CaptureFixture[str]) -> None:
+    """A framework Exit(N) yields N on both the fast and the Typer path."""
+    import typer
+
+    app = TypedTyper()
+
+    @app.command()
+    def quit() -> None:
+        raise typer.Exit(5)
+
+    @app.command()
+    def other() -> None:
+        pass
+
+    fast = run(app, ["prog", "quit"])
+    # A trailing "--" defeats the fast path but is argument-free to Click,
+    # so this exercises the same handler through the full Typer path.
+    slow = run(app, ["prog", "quit", "--"])
+
+    assert fast == 5
+    assert slow == 5
+
+
+def test_handler_return_value_ignored_across_paths(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Only Exit determines exit codes; a handler's plain return is discarded."""
+    app = TypedTyper()
+
+    @app.command()
+    def seven() -> int:
+        return 7
+
+    @app.command()
+    def other() -> None:
+        pass
+
+    assert run(app, ["prog", "seven"]) == 0
+    assert run(app, ["prog", "seven", "--"]) == 0